@@ -0,0 +1,14 @@
+# User service response messages, shared with the tests asserting on them.
+# Fill the placeholders with `str.format` using the named fields.
+
+USER_ALREADY_EXISTS = "User already exists with email: {email}"
+USER_REGISTERED = "User '{name}' successfully registered!"
+NO_USERS_EXIST = "No users exists"
+NO_USER_FOR_UID = "No user exists for given: {uid}"
+NO_USER_TO_UPDATE = "No user exists for given UID: {uid}"
+NO_USER_TO_DELETE = "No user exists for given id: {uid}"
+NO_USER_WITH_EMAIL = "No user with email: {email}"
+NO_USER_WITH_CREDENTIALS = "No user exists with {email} and supplied password."
+FIND_USER_FAILED = "Failed to find user with UID: {uid}. Error: {error}"
+UPDATE_USER_FAILED = "Failed to update user with UID: {uid}. Error: {error}"
+RETRIEVE_USER_FAILED = "Failed to retrieve user with {email} with error: {error}"
@@ -36,6 +36,17 @@ from .user import UserView
 from .user import UserViewPage
 from .user import check_pwd
 from .user import salt_and_hash_password
+from .user_messages import FIND_USER_FAILED
+from .user_messages import NO_USERS_EXIST
+from .user_messages import NO_USER_FOR_UID
+from .user_messages import NO_USER_TO_DELETE
+from .user_messages import NO_USER_TO_UPDATE
+from .user_messages import NO_USER_WITH_CREDENTIALS
+from .user_messages import NO_USER_WITH_EMAIL
+from .user_messages import RETRIEVE_USER_FAILED
+from .user_messages import UPDATE_USER_FAILED
+from .user_messages import USER_ALREADY_EXISTS
+from .user_messages import USER_REGISTERED
 from .user_roles import DATA_OWNER_ROLE_LEVEL
 from .user_roles import GUEST_ROLE_LEVEL
 from .user_roles import ServiceRole
@@ -66,7 +77,7 @@ class UserService(AbstractService):
             return SyftError(message=str(result.err()))
         user_exists = result.ok() is not None
         if user_exists:
-            return SyftError(message=f"User already exists with email: {user.email}")
+            return SyftError(message=USER_ALREADY_EXISTS.format(email=user.email))
 
         result = self.stash.set(
             credentials=context.credentials,
@@ -91,7 +102,7 @@ class UserService(AbstractService):
         if result.is_ok():
             user = result.ok()
             if user is None:
-                return SyftError(message=f"No user exists for given: {uid}")
+                return SyftError(message=NO_USER_FOR_UID.format(uid=uid))
             return user.to(UserView)
 
         return SyftError(message=str(result.err()))
@@ -127,7 +138,7 @@ class UserService(AbstractService):
             return results
 
         # 🟡 TODO: No user exists will happen when result.ok() is empty list
-        return SyftError(message="No users exists")
+        return SyftError(message=NO_USERS_EXIST)
 
     def get_role_for_credentials(
         self, credentials: Union[SyftVerifyKey, SyftSigningKey]
@@ -239,15 +250,13 @@ class UserService(AbstractService):
                 raise UserAlreadyExistsException.raise_with_context(context=context)
 
         if result.is_err():
-            error_msg = (
-                f"Failed to find user with UID: {uid}. Error: {str(result.err())}"
-            )
+            error_msg = FIND_USER_FAILED.format(uid=uid, error=result.err())
             return SyftError(message=error_msg)
 
         user = result.ok()
 
         if user is None:
-            return SyftError(message=f"No user exists for given UID: {uid}")
+            return SyftError(message=NO_USER_TO_UPDATE.format(uid=uid))
 
         if updates_role:
             if context.role == ServiceRole.ADMIN:
@@ -295,9 +304,7 @@ class UserService(AbstractService):
         )
 
         if result.is_err():
-            error_msg = (
-                f"Failed to update user with UID: {uid}. Error: {str(result.err())}"
-            )
+            error_msg = UPDATE_USER_FAILED.format(uid=uid, error=result.err())
             return SyftError(message=error_msg)
 
         user = result.ok()
@@ -319,7 +326,7 @@ class UserService(AbstractService):
             return SyftError(message=str(user_result.err()))
         user = user_result.ok()
         if user is None:
-            return SyftError(message=f"No user exists for given id: {uid}")
+            return SyftError(message=NO_USER_TO_DELETE.format(uid=uid))
         else:
             return user
 
@@ -379,13 +386,15 @@ class UserService(AbstractService):
                 return user.to(UserPrivateKey)
 
             return SyftError(
-                message="No user exists with "
-                f"{context.login_credentials.email} and supplied password."
+                message=NO_USER_WITH_CREDENTIALS.format(
+                    email=context.login_credentials.email
+                )
             )
 
         return SyftError(
-            message="Failed to retrieve user with "
-            f"{context.login_credentials.email} with error: {result.err()}"
+            message=RETRIEVE_USER_FAILED.format(
+                email=context.login_credentials.email, error=result.err()
+            )
         )
 
     def admin_verify_key(self) -> Union[SyftVerifyKey, SyftError]:
@@ -426,7 +435,7 @@ class UserService(AbstractService):
             return SyftError(message=str(result.err()))
         user_exists = result.ok() is not None
         if user_exists:
-            return SyftError(message=f"User already exists with email: {user.email}")
+            return SyftError(message=USER_ALREADY_EXISTS.format(email=user.email))
 
         result = self.stash.set(
             credentials=user.verify_key,
@@ -442,7 +451,7 @@ class UserService(AbstractService):
 
         user = result.ok()
 
-        success_message = f"User '{user.name}' successfully registered!"
+        success_message = USER_REGISTERED.format(name=user.name)
         if request_user_role in DATA_OWNER_ROLE_LEVEL:
             success_message += " To see users, run `[your_client].users`"
         msg = SyftSuccess(message=success_message)
@@ -454,7 +463,7 @@ class UserService(AbstractService):
         result = self.stash.get_by_email(credentials=credentials, email=email)
         if result.ok() is not None:
             return result.ok().verify_key
-        return SyftError(message=f"No user with email: {email}")
+        return SyftError(message=NO_USER_WITH_EMAIL.format(email=email))
 
     def get_by_verify_key(
         self, verify_key: SyftVerifyKey
@@ -1,10 +1,18 @@
 # stdlib
+import atexit
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from concurrent.futures import wait
 from io import BytesIO
-import math
 from pathlib import Path
+import threading
+from typing import BinaryIO
+from typing import Dict
 from typing import Generator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -14,7 +22,9 @@ from botocore.client import BaseClient as S3BaseClient
 from botocore.client import ClientError as BotoClientError
 from botocore.client import Config
 import requests
+from requests.adapters import HTTPAdapter
 from typing_extensions import Self
+from urllib3.util.retry import Retry
 
 # relative
 from . import BlobDeposit
@@ -40,14 +50,62 @@ from ...util.constants import DEFAULT_TIMEOUT
 READ_EXPIRATION_TIME = 1800  # seconds
 WRITE_EXPIRATION_TIME = 900  # seconds
 DEFAULT_CHUNK_SIZE = 1024**3  # 1 GB
+MAX_UPLOAD_CONCURRENCY = 8
+# bytes of a streamed (file-like) source that may be read ahead of the uploads
+MAX_STREAMED_UPLOAD_BYTES = DEFAULT_CHUNK_SIZE
 
 
-def _byte_chunks(bytes: BytesIO, size: int) -> Generator[bytes, None, None]:
+def _is_in_memory(data: Union[bytes, BinaryIO]) -> bool:
+    return isinstance(data, (bytes, bytearray, memoryview, BytesIO))
+
+
+def _byte_chunks(
+    data: Union[bytes, BinaryIO], size: int
+) -> Generator[Union[bytes, memoryview], None, None]:
+    # in-memory buffers are sliced through a memoryview so that no chunk is copied,
+    # any other file-like object is read lazily one chunk at a time
+    if isinstance(data, BytesIO):
+        data = data.getbuffer()[data.tell() :]
+    if _is_in_memory(data):
+        view = memoryview(data)
+        for offset in range(0, len(view), size):
+            yield view[offset : offset + size]
+        return
+
     while True:
         try:
-            yield bytes.read(size)
+            chunk = data.read(size)
         except BlockingIOError:
             return
+        if not chunk:
+            return
+        yield chunk
+
+
+def _upload_session() -> requests.Session:
+    # one pooled connection per upload worker, retrying transient server errors
+    adapter = HTTPAdapter(
+        pool_connections=MAX_UPLOAD_CONCURRENCY,
+        pool_maxsize=MAX_UPLOAD_CONCURRENCY,
+        max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]
+        ),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _put_part(
+    session: requests.Session,
+    part_no: int,
+    byte_chunk: Union[bytes, memoryview],
+    blob_url: GridURL,
+) -> Dict:
+    response = session.put(url=str(blob_url), data=byte_chunk, timeout=DEFAULT_TIMEOUT)
+    response.raise_for_status()
+    return {"ETag": response.headers["ETag"], "PartNumber": part_no}
 
 
 @serializable()
@@ -57,7 +115,7 @@ class SeaweedFSBlobDeposit(BlobDeposit):
 
     urls: List[GridURL]
 
-    def write(self, data: BytesIO) -> Union[SyftSuccess, SyftError]:
+    def write(self, data: Union[bytes, BinaryIO]) -> Union[SyftSuccess, SyftError]:
         # relative
         from ...client.api import APIRegistry
 
@@ -68,23 +126,57 @@ class SeaweedFSBlobDeposit(BlobDeposit):
 
         etags = []
 
-        try:
-            for part_no, (byte_chunk, url) in enumerate(
-                zip(_byte_chunks(data, DEFAULT_CHUNK_SIZE), self.urls),
-                start=1,
-            ):
-                if api is not None:
-                    blob_url = api.connection.to_blob_route(url.url_path)
-                else:
-                    blob_url = url
-                response = requests.put(
-                    url=str(blob_url), data=byte_chunk, timeout=DEFAULT_TIMEOUT
-                )
-                response.raise_for_status()
-                etag = response.headers["ETag"]
-                etags.append({"ETag": etag, "PartNumber": part_no})
-        except requests.RequestException as e:
-            return SyftError(message=str(e))
+        # slices of an in-memory buffer cost nothing to hold, but every chunk of a
+        # streamed source is a fresh read, so bound how many of those are alive
+        if _is_in_memory(data):
+            max_in_flight = MAX_UPLOAD_CONCURRENCY
+        else:
+            max_in_flight = min(
+                MAX_UPLOAD_CONCURRENCY,
+                max(1, MAX_STREAMED_UPLOAD_BYTES // DEFAULT_CHUNK_SIZE),
+            )
+
+        parts = enumerate(
+            zip(_byte_chunks(data, DEFAULT_CHUNK_SIZE), self.urls), start=1
+        )
+
+        with _upload_session() as session, ThreadPoolExecutor(
+            max_workers=max_in_flight
+        ) as executor:
+            pending = set()
+            try:
+                while True:
+                    # wait for a free slot before reading the next chunk
+                    if len(pending) >= max_in_flight:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        etags.extend(future.result() for future in done)
+
+                    part = next(parts, None)
+                    if part is None:
+                        break
+                    part_no, (byte_chunk, url) = part
+
+                    if api is not None:
+                        blob_url = api.connection.to_blob_route(url.url_path)
+                    else:
+                        blob_url = url
+                    pending.add(
+                        executor.submit(
+                            _put_part, session, part_no, byte_chunk, blob_url
+                        )
+                    )
+                    # only the upload keeps the chunk alive from here on
+                    del part, byte_chunk
+
+                for future in as_completed(pending):
+                    etags.append(future.result())
+            except requests.RequestException as e:
+                for future in pending:
+                    future.cancel()
+                return SyftError(message=str(e))
+
+        # parts may finish out of order, but the upload must list them in order
+        etags.sort(key=lambda etag: etag["PartNumber"])
 
         mark_write_complete_method = from_api_or_context(
             func_or_path="blob_storage.mark_write_complete",
@@ -112,20 +204,44 @@ class SeaweedFSClientConfig(BlobStorageClientConfig):
         return grid_url.url
 
 
+# building a boto3 client loads botocore's service models, so clients are created
+# once per configuration and shared by every connection for the process lifetime
+_S3_CLIENTS: Dict[Tuple[str, str, str, str], S3BaseClient] = {}
+_S3_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_s3_client(config: SeaweedFSClientConfig) -> S3BaseClient:
+    key = (config.endpoint_url, config.access_key, config.secret_key, config.region)
+    with _S3_CLIENTS_LOCK:
+        client = _S3_CLIENTS.get(key)
+        if client is None:
+            client = boto3.client(
+                "s3",
+                endpoint_url=config.endpoint_url,
+                aws_access_key_id=config.access_key,
+                aws_secret_access_key=config.secret_key,
+                config=Config(signature_version="s3v4"),
+                region_name=config.region,
+            )
+            _S3_CLIENTS[key] = client
+    return client
+
+
+@atexit.register
+def _close_s3_clients() -> None:
+    with _S3_CLIENTS_LOCK:
+        for client in _S3_CLIENTS.values():
+            client.close()
+        _S3_CLIENTS.clear()
+
+
 @serializable()
 class SeaweedFSClient(BlobStorageClient):
     config: SeaweedFSClientConfig
 
     def connect(self) -> BlobStorageConnection:
         return SeaweedFSConnection(
-            client=boto3.client(
-                "s3",
-                endpoint_url=self.config.endpoint_url,
-                aws_access_key_id=self.config.access_key,
-                aws_secret_access_key=self.config.secret_key,
-                config=Config(signature_version="s3v4"),
-                region_name=self.config.region,
-            ),
+            client=_get_s3_client(self.config),
             bucket_name=self.config.bucket_name,
         )
 
@@ -143,7 +259,8 @@ class SeaweedFSConnection(BlobStorageConnection):
         return self
 
     def __exit__(self, *exc) -> None:
-        self.client.close()
+        # the client is shared, see _get_s3_client
+        pass
 
     def read(self, fp: SecureFilePathLocation, type_: Optional[Type]) -> BlobRetrieval:
         try:
@@ -176,7 +293,7 @@ class SeaweedFSConnection(BlobStorageConnection):
             )
 
     def write(self, obj: BlobStorageEntry) -> BlobDeposit:
-        total_parts = math.ceil(obj.file_size / DEFAULT_CHUNK_SIZE)
+        total_parts = -(-obj.file_size // DEFAULT_CHUNK_SIZE)
 
         urls = [
             GridURL.from_url(
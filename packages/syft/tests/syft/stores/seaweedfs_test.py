@@ -0,0 +1,160 @@
+# stdlib
+from io import BytesIO
+from pathlib import Path
+import threading
+import time
+from typing import Dict
+from typing import List
+
+# third party
+import pytest
+from pytest import MonkeyPatch
+import requests
+
+# syft absolute
+from syft.service.response import SyftError
+from syft.service.response import SyftSuccess
+from syft.store.blob_storage import seaweedfs
+from syft.store.blob_storage.seaweedfs import SeaweedFSBlobDeposit
+from syft.store.blob_storage.seaweedfs import _byte_chunks
+from syft.types.grid_url import GridURL
+from syft.types.uid import UID
+
+DATA = b"abcdefghij"
+CHUNK_SIZE = 3
+EXPECTED_CHUNKS = [b"abc", b"def", b"ghi", b"j"]
+
+
+@pytest.fixture
+def deposit(monkeypatch: MonkeyPatch) -> SeaweedFSBlobDeposit:
+    monkeypatch.setattr(seaweedfs, "DEFAULT_CHUNK_SIZE", CHUNK_SIZE)
+    urls = [
+        GridURL.from_url(f"http://localhost:8333/bucket/file?partNumber={i}")
+        for i in range(1, len(EXPECTED_CHUNKS) + 1)
+    ]
+    return SeaweedFSBlobDeposit(blob_storage_entry_id=UID(), urls=urls)
+
+
+@pytest.fixture
+def completed_etags(monkeypatch: MonkeyPatch) -> List[List[Dict]]:
+    calls = []
+
+    def mark_write_complete(etags: List[Dict], uid: UID) -> SyftSuccess:
+        calls.append(etags)
+        return SyftSuccess(message="Successfully saved file.")
+
+    monkeypatch.setattr(
+        seaweedfs, "from_api_or_context", lambda **kwargs: mark_write_complete
+    )
+    return calls
+
+
+def test_byte_chunks_bytes() -> None:
+    chunks = [bytes(chunk) for chunk in _byte_chunks(DATA, CHUNK_SIZE)]
+    assert chunks == EXPECTED_CHUNKS
+
+
+def test_byte_chunks_bytes_io_from_current_position() -> None:
+    buffer = BytesIO(b"xx" + DATA)
+    buffer.seek(2)
+    chunks = [bytes(chunk) for chunk in _byte_chunks(buffer, CHUNK_SIZE)]
+    assert chunks == EXPECTED_CHUNKS
+
+
+def test_byte_chunks_file_stops_at_eof(tmp_path: Path) -> None:
+    file_path = tmp_path / "blob"
+    file_path.write_bytes(DATA)
+    with open(file_path, "rb") as f:
+        chunks = list(_byte_chunks(f, CHUNK_SIZE))
+    assert chunks == EXPECTED_CHUNKS
+
+
+def test_write_sends_etags_in_part_order(
+    monkeypatch: MonkeyPatch,
+    deposit: SeaweedFSBlobDeposit,
+    completed_etags: List[List[Dict]],
+) -> None:
+    def put_part(session, part_no, byte_chunk, blob_url) -> Dict:
+        # later parts finish first
+        time.sleep(0.05 * (len(EXPECTED_CHUNKS) - part_no))
+        return {"ETag": f"etag-{bytes(byte_chunk).decode()}", "PartNumber": part_no}
+
+    monkeypatch.setattr(seaweedfs, "_put_part", put_part)
+
+    response = deposit.write(DATA)
+
+    assert isinstance(response, SyftSuccess)
+    assert completed_etags == [
+        [
+            {"ETag": f"etag-{chunk.decode()}", "PartNumber": part_no}
+            for part_no, chunk in enumerate(EXPECTED_CHUNKS, start=1)
+        ]
+    ]
+
+
+def test_write_failing_part_stops_upload(
+    monkeypatch: MonkeyPatch,
+    deposit: SeaweedFSBlobDeposit,
+    completed_etags: List[List[Dict]],
+) -> None:
+    uploaded_parts = []
+    second_part_started = threading.Event()
+
+    def put_part(session, part_no, byte_chunk, blob_url) -> Dict:
+        uploaded_parts.append(part_no)
+        if part_no == 1:
+            # fail while part 2 is still uploading
+            second_part_started.wait(timeout=1)
+            raise requests.ConnectionError("volume server unreachable")
+        second_part_started.set()
+        time.sleep(0.1)
+        return {"ETag": f"etag-{part_no}", "PartNumber": part_no}
+
+    monkeypatch.setattr(seaweedfs, "MAX_UPLOAD_CONCURRENCY", 2)
+    monkeypatch.setattr(seaweedfs, "_put_part", put_part)
+
+    response = deposit.write(DATA)
+
+    assert isinstance(response, SyftError)
+    assert "volume server unreachable" in response.message
+    assert sorted(uploaded_parts) == [1, 2]
+    assert completed_etags == []
+
+
+def test_write_streamed_source_bounds_read_ahead(
+    monkeypatch: MonkeyPatch,
+    deposit: SeaweedFSBlobDeposit,
+    completed_etags: List[List[Dict]],
+) -> None:
+    lock = threading.Lock()
+    alive_chunks = 0
+    max_alive_chunks = 0
+
+    class Stream:
+        def __init__(self, data: bytes) -> None:
+            self.buffer = BytesIO(data)
+
+        def read(self, size: int) -> bytes:
+            nonlocal alive_chunks, max_alive_chunks
+            chunk = self.buffer.read(size)
+            if chunk:
+                with lock:
+                    alive_chunks += 1
+                    max_alive_chunks = max(max_alive_chunks, alive_chunks)
+            return chunk
+
+    def put_part(session, part_no, byte_chunk, blob_url) -> Dict:
+        nonlocal alive_chunks
+        time.sleep(0.02)
+        with lock:
+            alive_chunks -= 1
+        return {"ETag": f"etag-{part_no}", "PartNumber": part_no}
+
+    monkeypatch.setattr(seaweedfs, "MAX_STREAMED_UPLOAD_BYTES", 2 * CHUNK_SIZE)
+    monkeypatch.setattr(seaweedfs, "_put_part", put_part)
+
+    response = deposit.write(Stream(DATA))
+
+    assert isinstance(response, SyftSuccess)
+    assert [etag["PartNumber"] for etag in completed_etags[0]] == [1, 2, 3, 4]
+    assert max_alive_chunks == 2
@@ -1,3 +1,9 @@
+# stdlib
+import itertools
+from typing import Any
+from typing import Callable
+from uuid import UUID
+
 # third party
 import pytest
 
@@ -17,6 +23,14 @@ from syft.service.user.user_roles import ServiceRole
 from syft.service.user.user_service import UserService
 from syft.service.user.user_stash import UserStash
 from syft.store.document_store import DocumentStore
+from syft.types.uid import UID
+
+
+@pytest.fixture()
+def uid_factory() -> Callable[[], UID]:
+    # deterministic ids, so the tests don't pay for a uuid4 per UID
+    counter = itertools.count(start=1)
+    return lambda: UID(value=UUID(int=next(counter)))
 
 
 @pytest.fixture()
@@ -83,11 +97,7 @@ def admin_user_private_key(admin_user) -> UserPrivateKey:
 
 @pytest.fixture
 def guest_user_private_key(guest_user) -> UserPrivateKey:
-    return UserPrivateKey(
-        email=guest_user.email,
-        signing_key=guest_user.signing_key,
-        role=ServiceRole.GUEST,
-    )
+    return guest_user.to(UserPrivateKey)
 
 
 @pytest.fixture()
@@ -115,6 +125,20 @@ def user_service(document_store: DocumentStore):
     return UserService(store=document_store)
 
 
+@pytest.fixture
+def patch_stash(
+    monkeypatch: pytest.MonkeyPatch, user_service: UserService
+) -> Callable[..., None]:
+    # callables replace the stash method, any other value is returned as is
+    def _patch(**methods: Any) -> None:
+        for name, value in methods.items():
+            if not callable(value):
+                value = lambda *args, _value=value, **kwargs: _value  # noqa: E731
+            monkeypatch.setattr(user_service.stash, name, value)
+
+    return _patch
+
+
 @pytest.fixture
 def authed_context(admin_user: User, worker: Worker) -> AuthedServiceContext:
     return AuthedServiceContext(credentials=admin_user.verify_key, node=worker)
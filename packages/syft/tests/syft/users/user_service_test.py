@@ -1,12 +1,13 @@
 # stdlib
+from typing import Callable
 from typing import List
-from typing import Tuple
 from typing import Type
 from typing import Union
 from unittest import mock
 
 # third party
 from faker import Faker
+import pytest
 from pytest import MonkeyPatch
 from result import Err
 from result import Ok
@@ -24,10 +25,25 @@ from syft.service.user.user import UserCreate
 from syft.service.user.user import UserPrivateKey
 from syft.service.user.user import UserUpdate
 from syft.service.user.user import UserView
+from syft.service.user.user_messages import FIND_USER_FAILED
+from syft.service.user.user_messages import NO_USERS_EXIST
+from syft.service.user.user_messages import NO_USER_FOR_UID
+from syft.service.user.user_messages import NO_USER_TO_DELETE
+from syft.service.user.user_messages import NO_USER_TO_UPDATE
+from syft.service.user.user_messages import NO_USER_WITH_CREDENTIALS
+from syft.service.user.user_messages import NO_USER_WITH_EMAIL
+from syft.service.user.user_messages import RETRIEVE_USER_FAILED
+from syft.service.user.user_messages import UPDATE_USER_FAILED
+from syft.service.user.user_messages import USER_ALREADY_EXISTS
+from syft.service.user.user_messages import USER_REGISTERED
 from syft.service.user.user_roles import ServiceRole
 from syft.service.user.user_service import UserService
 from syft.types.uid import UID
 
+# the stash results most tests stub in, shared instead of rebuilt per test
+OK_NONE = Ok(None)
+ERR_EMPTY = Err("")
+
 
 def settings_with_signup_enabled(worker) -> Type:
     mock_settings = worker.settings
@@ -37,146 +53,111 @@ def settings_with_signup_enabled(worker) -> Type:
 
 
 def test_userservice_create_when_user_exists(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
     guest_create_user: UserCreate,
 ) -> None:
-    def mock_get_by_email(credentials: SyftVerifyKey, email: str) -> Ok:
-        return Ok(guest_create_user.to(User))
-
-    monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
+    patch_stash(get_by_email=Ok(guest_create_user.to(User)))
     response = user_service.create(authed_context, guest_create_user)
     assert isinstance(response, SyftError)
-    expected_error_message = (
-        f"User already exists with email: {guest_create_user.email}"
-    )
+    expected_error_message = USER_ALREADY_EXISTS.format(email=guest_create_user.email)
     assert expected_error_message == response.message
 
 
-def test_userservice_create_error_on_get_by_email(
-    monkeypatch: MonkeyPatch,
+@pytest.mark.parametrize(
+    "stash_returns,expected_error_msg",
+    [
+        pytest.param(
+            {"get_by_email": Err("Failed to get email")},
+            "Failed to get email",
+            id="get_by_email_fails",
+        ),
+        pytest.param(
+            {"get_by_email": OK_NONE, "set": Err("Failed to set user.")},
+            "Failed to set user.",
+            id="set_fails",
+        ),
+    ],
+)
+def test_userservice_create_errors(
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
     guest_create_user: UserCreate,
+    stash_returns: dict,
+    expected_error_msg: str,
 ) -> None:
-    def mock_get_by_email(credentials: SyftVerifyKey, email: str) -> Err:
-        return Err(f"No user exists with given email: {email}")
+    patch_stash(**stash_returns)
 
-    monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
     response = user_service.create(authed_context, guest_create_user)
     assert isinstance(response, SyftError)
-    expected_error_message = mock_get_by_email(None, guest_create_user.email).err()
-    assert response.message == expected_error_message
+    assert response.message == expected_error_msg
 
 
 def test_userservice_create_success(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
     guest_create_user: UserCreate,
 ) -> None:
-    def mock_get_by_email(credentials: SyftVerifyKey, email: str) -> Ok:
-        return Ok(None)
-
     expected_user = guest_create_user.to(User)
     expected_output = expected_user.to(UserView)
 
-    def mock_set(
-        credentials: SyftVerifyKey,
-        user: User,
-        has_permission: bool = False,
-        add_permissions=None,
-    ) -> Ok:
-        return Ok(expected_user)
-
-    monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
-    monkeypatch.setattr(user_service.stash, "set", mock_set)
+    patch_stash(get_by_email=OK_NONE, set=Ok(expected_user))
     response = user_service.create(authed_context, guest_create_user)
     assert isinstance(response, UserView)
-    assert response.to_dict() == expected_output.to_dict()
-
-
-def test_userservice_create_error_on_set(
-    monkeypatch: MonkeyPatch,
-    user_service: UserService,
-    authed_context: AuthedServiceContext,
-    guest_create_user: UserCreate,
-) -> None:
-    def mock_get_by_email(credentials: SyftVerifyKey, email: str) -> Ok:
-        return Ok(None)
-
-    expected_error_msg = "Failed to set user."
-
-    def mock_set(
-        credentials: SyftVerifyKey,
-        user: User,
-        has_permission: bool = False,
-        add_permissions=None,
-    ) -> Err:
-        return Err(expected_error_msg)
-
-    monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
-    monkeypatch.setattr(user_service.stash, "set", mock_set)
-    response = user_service.create(authed_context, guest_create_user)
-    assert isinstance(response, SyftError)
-    assert response.message == expected_error_msg
-
-
-def test_userservice_view_error_on_get_by_uid(
-    monkeypatch: MonkeyPatch,
-    user_service: UserService,
-    authed_context: AuthedServiceContext,
-) -> None:
-    uid_to_view = UID()
-    expected_error_msg = f"Failed to get uid: {uid_to_view}"
-
-    def mock_get_by_uid(credentials: SyftVerifyKey, uid: UID) -> Err:
-        return Err(expected_error_msg)
-
-    monkeypatch.setattr(user_service.stash, "get_by_uid", mock_get_by_uid)
-    response = user_service.view(authed_context, uid_to_view)
-    assert isinstance(response, SyftError)
-    assert response.message == expected_error_msg
+    assert response == expected_output
 
 
-def test_userservice_view_user_not_exists(
-    monkeypatch: MonkeyPatch,
+@pytest.mark.parametrize(
+    "stash_returns,expected_error_msg",
+    [
+        pytest.param(
+            {"get_by_uid": Err("Failed to get uid")},
+            "Failed to get uid",
+            id="get_by_uid_fails",
+        ),
+        pytest.param(
+            {"get_by_uid": OK_NONE},
+            NO_USER_FOR_UID,
+            id="user_not_exists",
+        ),
+    ],
+)
+def test_userservice_view_errors(
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
+    uid_factory: Callable[[], UID],
+    stash_returns: dict,
+    expected_error_msg: str,
 ) -> None:
-    uid_to_view = UID()
-    expected_error_msg = f"No user exists for given: {uid_to_view}"
-
-    def mock_get_by_uid(credentials: SyftVerifyKey, uid: UID) -> Ok:
-        return Ok(None)
+    uid_to_view = uid_factory()
+    patch_stash(**stash_returns)
 
-    monkeypatch.setattr(user_service.stash, "get_by_uid", mock_get_by_uid)
     response = user_service.view(authed_context, uid_to_view)
     assert isinstance(response, SyftError)
-    assert response.message == expected_error_msg
+    assert response.message == expected_error_msg.format(uid=uid_to_view)
 
 
 def test_userservice_view_user_success(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
     guest_user: User,
+    guest_view_user: UserView,
 ) -> None:
     uid_to_view = guest_user.id
-    expected_output = guest_user.to(UserView)
 
-    def mock_get_by_uid(credentials: SyftVerifyKey, uid: UID) -> Ok:
-        return Ok(guest_user)
-
-    monkeypatch.setattr(user_service.stash, "get_by_uid", mock_get_by_uid)
+    patch_stash(get_by_uid=Ok(guest_user))
     response = user_service.view(authed_context, uid_to_view)
     assert isinstance(response, UserView)
-    assert response == expected_output
+    assert response == guest_view_user
 
 
 def test_userservice_get_all_success(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
     guest_user: User,
@@ -185,37 +166,36 @@ def test_userservice_get_all_success(
     mock_get_all_output = [guest_user, admin_user]
     expected_output = [x.to(UserView) for x in mock_get_all_output]
 
-    def mock_get_all(credentials: SyftVerifyKey) -> Ok:
-        return Ok(mock_get_all_output)
-
-    monkeypatch.setattr(user_service.stash, "get_all", mock_get_all)
+    patch_stash(get_all=Ok(mock_get_all_output))
     response = user_service.get_all(authed_context)
-    assert isinstance(response, List)
+    assert isinstance(response, list)
     assert len(response) == len(expected_output)
     assert response == expected_output
 
 
 def test_userservice_get_all_error(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
 ) -> None:
-    expected_output_msg = "No users exists"
-
-    def mock_get_all(credentials: SyftVerifyKey) -> Err:
-        return Err("")
-
-    monkeypatch.setattr(user_service.stash, "get_all", mock_get_all)
+    patch_stash(get_all=ERR_EMPTY)
     response = user_service.get_all(authed_context)
     assert isinstance(response, SyftError)
-    assert response.message == expected_output_msg
+    assert response.message == NO_USERS_EXIST
 
 
+@pytest.mark.parametrize(
+    "search_fields",
+    [["id"], ["email"], ["name"], ["verify_key"], ["name", "email"]],
+    ids=["id", "email", "name", "verify_key", "name_and_email"],
+)
 def test_userservice_search(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
     guest_user: User,
+    guest_view_user: UserView,
+    search_fields: List[str],
 ) -> None:
     def mock_find_all(credentials: SyftVerifyKey, **kwargs) -> Union[Ok, Err]:
         for key, _ in kwargs.items():
@@ -223,39 +203,12 @@ def test_userservice_search(
                 return Ok([guest_user])
             return Err("Invalid kwargs")
 
-    monkeypatch.setattr(user_service.stash, "find_all", mock_find_all)
+    patch_stash(find_all=mock_find_all)
 
-    expected_output = [guest_user.to(UserView)]
-
-    # Search via id
-    response = user_service.search(authed_context, id=guest_user.id)
-    assert isinstance(response, List)
-    assert response == expected_output
-
-    # Search via email
-    response = user_service.search(authed_context, email=guest_user.email)
-    assert isinstance(response, List)
-    assert response == expected_output
-
-    # Search via name
-    response = user_service.search(authed_context, name=guest_user.name)
-    assert isinstance(response, List)
-    assert response == expected_output
-
-    # Search via verify_key
-    response = user_service.search(
-        authed_context,
-        verify_key=guest_user.verify_key,
-    )
-    assert isinstance(response, List)
-    assert response == expected_output
-
-    # Search via multiple kwargs
-    response = user_service.search(
-        authed_context, name=guest_user.name, email=guest_user.email
-    )
-    assert isinstance(response, List)
-    assert response == expected_output
+    search_kwargs = {field: getattr(guest_user, field) for field in search_fields}
+    response = user_service.search(authed_context, **search_kwargs)
+    assert isinstance(response, list)
+    assert response == [guest_view_user]
 
 
 def test_userservice_search_with_invalid_kwargs(
@@ -267,68 +220,56 @@ def test_userservice_search_with_invalid_kwargs(
     assert "Invalid Search parameters" in response.message
 
 
-def test_userservice_update_get_by_uid_fails(
-    monkeypatch: MonkeyPatch,
+@pytest.mark.parametrize(
+    "stash_returns,expected_error_msg",
+    [
+        pytest.param(
+            {"get_by_uid": Err("Invalid UID")},
+            FIND_USER_FAILED,
+            id="get_by_uid_fails",
+        ),
+        pytest.param(
+            {"get_by_uid": OK_NONE},
+            NO_USER_TO_UPDATE,
+            id="user_not_exists",
+        ),
+    ],
+)
+def test_userservice_update_errors(
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
+    uid_factory: Callable[[], UID],
     update_user: UserUpdate,
+    stash_returns: dict,
+    expected_error_msg: str,
 ) -> None:
-    random_uid = UID()
-    get_by_uid_err_msg = "Invalid UID"
-    expected_error_msg = (
-        f"Failed to find user with UID: {random_uid}. Error: {get_by_uid_err_msg}"
-    )
-
-    def mock_get_by_uid(credentials: SyftVerifyKey, uid: UID) -> Err:
-        return Err(get_by_uid_err_msg)
-
-    monkeypatch.setattr(user_service.stash, "get_by_uid", mock_get_by_uid)
+    random_uid = uid_factory()
+    patch_stash(**stash_returns)
 
     response = user_service.update(
         authed_context, uid=random_uid, user_update=update_user
     )
     assert isinstance(response, SyftError)
-    assert response.message == expected_error_msg
-
-
-def test_userservice_update_no_user_exists(
-    monkeypatch: MonkeyPatch,
-    user_service: UserService,
-    authed_context: AuthedServiceContext,
-    update_user: UserUpdate,
-) -> None:
-    random_uid = UID()
-    expected_error_msg = f"No user exists for given UID: {random_uid}"
-
-    def mock_get_by_uid(credentials: SyftVerifyKey, uid: UID) -> Ok:
-        return Ok(None)
-
-    monkeypatch.setattr(user_service.stash, "get_by_uid", mock_get_by_uid)
-
-    response = user_service.update(
-        authed_context, uid=random_uid, user_update=update_user
+    stash_error = stash_returns["get_by_uid"].err()
+    assert response.message == expected_error_msg.format(
+        uid=random_uid, error=stash_error
     )
-    assert isinstance(response, SyftError)
-    assert response.message == expected_error_msg
 
 
 def test_userservice_update_success(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
     guest_user: User,
     update_user: UserUpdate,
 ) -> None:
-    def mock_get_by_uid(credentials: SyftVerifyKey, uid: UID) -> Ok:
-        return Ok(guest_user)
-
     def mock_update(credentials: SyftVerifyKey, user: User, has_permission: bool) -> Ok:
         guest_user.name = update_user.name
         guest_user.email = update_user.email
         return Ok(guest_user)
 
-    monkeypatch.setattr(user_service.stash, "update", mock_update)
-    monkeypatch.setattr(user_service.stash, "get_by_uid", mock_get_by_uid)
+    patch_stash(update=mock_update, get_by_uid=Ok(guest_user))
     authed_context.role = ServiceRole.ADMIN
 
     resultant_user = user_service.update(
@@ -340,27 +281,20 @@ def test_userservice_update_success(
 
 
 def test_userservice_update_fails(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
     guest_user: User,
     update_user: UserUpdate,
 ) -> None:
     update_error_msg = "Failed to reach server."
-    expected_error_msg = (
-        f"Failed to update user with UID: {guest_user.id}. Error: {update_error_msg}"
+    expected_error_msg = UPDATE_USER_FAILED.format(
+        uid=guest_user.id, error=update_error_msg
     )
 
-    def mock_get_by_uid(credentials: SyftVerifyKey, uid: UID) -> Ok:
-        return Ok(guest_user)
-
-    def mock_update(credentials: SyftVerifyKey, user, has_permission: bool) -> Err:
-        return Err(update_error_msg)
-
     authed_context.role = ServiceRole.ADMIN
 
-    monkeypatch.setattr(user_service.stash, "update", mock_update)
-    monkeypatch.setattr(user_service.stash, "get_by_uid", mock_get_by_uid)
+    patch_stash(update=Err(update_error_msg), get_by_uid=Ok(guest_user))
 
     response = user_service.update(
         authed_context, uid=guest_user.id, user_update=update_user
@@ -370,19 +304,15 @@ def test_userservice_update_fails(
 
 
 def test_userservice_delete_failure(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
+    uid_factory: Callable[[], UID],
 ) -> None:
-    id_to_delete = UID()
-    expected_error_msg = f"No user exists for given id: {id_to_delete}"
-
-    def mock_delete_by_uid(
-        credentials: SyftVerifyKey, uid: UID, has_permission=False
-    ) -> Err:
-        return Err(expected_error_msg)
+    id_to_delete = uid_factory()
+    expected_error_msg = NO_USER_TO_DELETE.format(uid=id_to_delete)
 
-    monkeypatch.setattr(user_service.stash, "delete_by_uid", mock_delete_by_uid)
+    patch_stash(delete_by_uid=Err(expected_error_msg))
 
     response = user_service.delete(context=authed_context, uid=id_to_delete)
     assert isinstance(response, SyftError)
@@ -391,22 +321,20 @@ def test_userservice_delete_failure(
 
 def test_userservice_delete_success(
     monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     authed_context: AuthedServiceContext,
+    uid_factory: Callable[[], UID],
 ) -> None:
-    id_to_delete = UID()
+    id_to_delete = uid_factory()
     expected_output = SyftSuccess(message=f"ID: {id_to_delete} deleted")
 
-    def mock_delete_by_uid(
-        credentials: SyftVerifyKey, uid: UID, has_permission: bool = False
-    ) -> Ok:
-        return Ok(expected_output)
-
-    def mock_get_target_object(credentials: SyftVerifyKey, uid):
-        return User(email=Faker().email())
-
-    monkeypatch.setattr(user_service.stash, "delete_by_uid", mock_delete_by_uid)
-    monkeypatch.setattr(user_service, "get_target_object", mock_get_target_object)
+    patch_stash(delete_by_uid=Ok(expected_output))
+    monkeypatch.setattr(
+        user_service,
+        "get_target_object",
+        lambda credentials, uid: User(email=Faker().email()),
+    )
     authed_context.role = ServiceRole.ADMIN
 
     response = user_service.delete(context=authed_context, uid=id_to_delete)
@@ -415,41 +343,32 @@ def test_userservice_delete_success(
 
 
 def test_userservice_user_verify_key(
-    monkeypatch: MonkeyPatch, user_service: UserService, guest_user: User
+    patch_stash: Callable[..., None], user_service: UserService, guest_user: User
 ) -> None:
-    def mock_get_by_email(credentials: SyftVerifyKey, email: str) -> Ok:
-        return Ok(guest_user)
-
-    monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
+    patch_stash(get_by_email=Ok(guest_user))
 
     response = user_service.user_verify_key(email=guest_user.email)
     assert response == guest_user.verify_key
 
 
 def test_userservice_user_verify_key_invalid_email(
-    monkeypatch: MonkeyPatch, user_service: UserService, faker: Faker
+    patch_stash: Callable[..., None], user_service: UserService, faker: Faker
 ) -> None:
     email = faker.email()
-    expected_output = SyftError(message=f"No user with email: {email}")
+    expected_output = SyftError(message=NO_USER_WITH_EMAIL.format(email=email))
 
-    def mock_get_by_email(credentials: SyftVerifyKey, email: str) -> Err:
-        return Err("No user found")
-
-    monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
+    patch_stash(get_by_email=Err("No user found"))
 
     response = user_service.user_verify_key(email=email)
     assert response == expected_output
 
 
 def test_userservice_admin_verify_key_error(
-    monkeypatch: MonkeyPatch, user_service: UserService
+    patch_stash: Callable[..., None], user_service: UserService
 ) -> None:
     expected_output = "failed to get admin verify_key"
 
-    def mock_admin_verify_key() -> Err:
-        return Err(expected_output)
-
-    monkeypatch.setattr(user_service.stash, "admin_verify_key", mock_admin_verify_key)
+    patch_stash(admin_verify_key=Err(expected_output))
 
     response = user_service.admin_verify_key()
     assert isinstance(response, SyftError)
@@ -465,16 +384,13 @@ def test_userservice_admin_verify_key_success(
 
 
 def test_userservice_register_user_exists(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     worker: Worker,
     guest_create_user: UserCreate,
 ) -> None:
-    def mock_get_by_email(credentials: SyftVerifyKey, email):
-        return Ok(guest_create_user)
-
-    monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
-    expected_error_msg = f"User already exists with email: {guest_create_user.email}"
+    patch_stash(get_by_email=Ok(guest_create_user))
+    expected_error_msg = USER_ALREADY_EXISTS.format(email=guest_create_user.email)
 
     # Patch Worker settings to enable signup
     with mock.patch(
@@ -490,18 +406,30 @@ def test_userservice_register_user_exists(
         assert response.message == expected_error_msg
 
 
-def test_userservice_register_error_on_get_email(
-    monkeypatch: MonkeyPatch,
+@pytest.mark.parametrize(
+    "stash_returns,expected_error_msg",
+    [
+        pytest.param(
+            {"get_by_email": Err("Failed to get email")},
+            "Failed to get email",
+            id="get_by_email_fails",
+        ),
+        pytest.param(
+            {"get_by_email": OK_NONE, "set": Err("Failed to connect to server.")},
+            "Failed to connect to server.",
+            id="set_fails",
+        ),
+    ],
+)
+def test_userservice_register_errors(
+    patch_stash: Callable[..., None],
     user_service: UserService,
     guest_create_user: UserCreate,
     worker: Worker,
+    stash_returns: dict,
+    expected_error_msg: str,
 ) -> None:
-    expected_error_msg = "Failed to get email"
-
-    def mock_get_by_email(credentials: SyftVerifyKey, email):
-        return Err(expected_error_msg)
-
-    monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
+    patch_stash(**stash_returns)
 
     # Patch Worker settings to enable signup
     with mock.patch(
@@ -518,20 +446,14 @@ def test_userservice_register_error_on_get_email(
 
 
 def test_userservice_register_success(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     worker: Worker,
     guest_create_user: UserCreate,
     guest_user: User,
+    guest_user_private_key: UserPrivateKey,
 ) -> None:
-    def mock_get_by_email(credentials: SyftVerifyKey, email: str) -> Ok:
-        return Ok(None)
-
-    def mock_set(*args, **kwargs) -> Ok:
-        return Ok(guest_user)
-
-        # Patch Worker settings to enable signup
-
+    # Patch Worker settings to enable signup
     with mock.patch(
         "syft.Worker.settings",
         new_callable=mock.PropertyMock,
@@ -540,108 +462,63 @@ def test_userservice_register_success(
         mock_worker = Worker.named(name="mock-node")
         node_context = NodeServiceContext(node=mock_worker)
 
-        monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
-        monkeypatch.setattr(user_service.stash, "set", mock_set)
+        patch_stash(get_by_email=OK_NONE, set=Ok(guest_user))
 
-        expected_msg = f"User '{guest_create_user.name}' successfully registered!"
-        expected_private_key = guest_user.to(UserPrivateKey)
+        expected_msg = USER_REGISTERED.format(name=guest_create_user.name)
 
         response = user_service.register(node_context, guest_create_user)
-        assert isinstance(response, Tuple)
+        assert isinstance(response, tuple)
 
         syft_success_response, user_private_key = response
         assert isinstance(syft_success_response, SyftSuccess)
         assert syft_success_response.message == expected_msg
 
         assert isinstance(user_private_key, UserPrivateKey)
-        assert user_private_key == expected_private_key
-
-
-def test_userservice_register_set_fail(
-    monkeypatch: MonkeyPatch,
-    user_service: UserService,
-    worker: Worker,
-    guest_create_user: UserCreate,
-) -> None:
-    def mock_get_by_email(credentials: SyftVerifyKey, email: str) -> Ok:
-        return Ok(None)
-
-    expected_error_msg = "Failed to connect to server."
-
-    def mock_set(
-        credentials: SyftVerifyKey,
-        user: User,
-        add_permissions=None,
-        has_permission: bool = False,
-    ) -> Err:
-        return Err(expected_error_msg)
-
-    with mock.patch(
-        "syft.Worker.settings",
-        new_callable=mock.PropertyMock,
-        return_value=settings_with_signup_enabled(worker),
-    ):
-        mock_worker = Worker.named(name="mock-node")
-        node_context = NodeServiceContext(node=mock_worker)
-
-        monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
-        monkeypatch.setattr(user_service.stash, "set", mock_set)
-
-        response = user_service.register(node_context, guest_create_user)
-        assert isinstance(response, SyftError)
-        assert response.message == expected_error_msg
+        assert user_private_key == guest_user_private_key
 
 
 def test_userservice_exchange_credentials(
-    monkeypatch: MonkeyPatch,
+    patch_stash: Callable[..., None],
     user_service: UserService,
     unauthed_context: UnauthedServiceContext,
     guest_user: User,
+    guest_user_private_key: UserPrivateKey,
 ) -> None:
-    def mock_get_by_email(credentials: SyftVerifyKey, email: str) -> Ok:
-        return Ok(guest_user)
-
-    monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
-    expected_user_private_key = guest_user.to(UserPrivateKey)
+    patch_stash(get_by_email=Ok(guest_user))
 
     response = user_service.exchange_credentials(unauthed_context)
     assert isinstance(response, UserPrivateKey)
-    assert response == expected_user_private_key
-
-
-def test_userservice_exchange_credentials_invalid_user(
-    monkeypatch: MonkeyPatch,
-    user_service: UserService,
-    unauthed_context: UnauthedServiceContext,
-    guest_user: User,
-) -> None:
-    def mock_get_by_email(credentials: SyftVerifyKey, email):
-        return Ok(None)
-
-    monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
-    expected_error_msg = (
-        f"No user exists with {guest_user.email} and supplied password."
-    )
-
-    response = user_service.exchange_credentials(unauthed_context)
-    assert isinstance(response, SyftError)
-    assert response.message == expected_error_msg
-
-
-def test_userservice_exchange_credentials_get_email_fails(
-    monkeypatch: MonkeyPatch,
+    assert response == guest_user_private_key
+
+
+@pytest.mark.parametrize(
+    "stash_returns,expected_error_msg",
+    [
+        pytest.param(
+            {"get_by_email": OK_NONE},
+            NO_USER_WITH_CREDENTIALS,
+            id="user_not_exists",
+        ),
+        pytest.param(
+            {"get_by_email": Err("Failed to connect to server.")},
+            RETRIEVE_USER_FAILED,
+            id="get_by_email_fails",
+        ),
+    ],
+)
+def test_userservice_exchange_credentials_errors(
+    patch_stash: Callable[..., None],
     user_service: UserService,
     unauthed_context: UnauthedServiceContext,
     guest_user: User,
+    stash_returns: dict,
+    expected_error_msg: str,
 ) -> None:
-    get_by_email_error = "Failed to connect to server."
-
-    def mock_get_by_email(credentials: SyftVerifyKey, email: str) -> Err:
-        return Err(get_by_email_error)
-
-    monkeypatch.setattr(user_service.stash, "get_by_email", mock_get_by_email)
-    expected_error_msg = f"Failed to retrieve user with {guest_user.email} with error: {get_by_email_error}"
+    patch_stash(**stash_returns)
 
     response = user_service.exchange_credentials(unauthed_context)
     assert isinstance(response, SyftError)
-    assert response.message == expected_error_msg
+    stash_error = stash_returns["get_by_email"].err()
+    assert response.message == expected_error_msg.format(
+        email=guest_user.email, error=stash_error
+    )